@@ -3,6 +3,43 @@ import re
 import glob
 from pathlib import Path
 
+# Map each input file to the source it represents
+FILE_MAPPINGS = {
+    '2018_speaking_tour_contacts.csv': '2018 Speaking Tour',
+    'Defund Racism Contact  - Everyone.csv': 'Defund Racism',
+    'US Campaign supporters - Sheet1.csv': 'US Campaign Supporters',
+    'US Campaign supporters - Sheet1 (1).csv': 'US Campaign Supporters',
+    'good_shepherd_collective_contacts.csv': 'Good Shepherd Collective',
+    'new_website_subscribers_backup.csv': 'Website Subscribers',
+    '50,000 final 1_19_2018.csv - 50,000 final 1_19_2018.csv.csv': 'International Contacts',
+    'Download.CSV - Download.CSV.csv': 'PayPal Subscribers',
+    'final_cleaning_7_21_2018_valid - final_cleaning_7_21_2018_valid.csv': 'Cleaned 2018 List',
+    'Untitled spreadsheet - Sheet1.csv': 'Additional Contacts',
+    'bot_subscribers_to_delete.csv': 'Bot Subscribers',
+    'wpforms-2013-Petition-ID-2013-2023-12-11-18-09-47 - wpforms-2013-Petition-ID-2013-2023-12-11-18-09-47.csv': 'Petition Signers',
+    'new report - new report.csv': 'New Report',
+    '2064876-6478ace66c7eaba50e79d802-jx7sWo - 2064876-6478ace66c7eaba50e79d802-jx7sWo.csv': 'Export Data',
+    'HcmComm-Customers-Export--2024-10-27-06-55-16 - HcmComm-Customers-Export--2024-10-27-06-55-16.csv': 'HcmComm Customers',
+    'Fundraising Report via SalesForce.xlsx - main.csv': 'SalesForce Fundraising'
+}
+
+# Source for Drive exports that have no entry in FILE_MAPPINGS yet
+UNMAPPED_SOURCE = 'Unmapped Drive Export'
+
+# One bit per distinct source, in registry order. Only append new sources to
+# FILE_MAPPINGS so existing SourceMask values keep their meaning.
+SOURCE_BITS = {source: 1 << i for i, source in enumerate(dict.fromkeys(FILE_MAPPINGS.values()))}
+
+# Unmapped exports use a reserved top bit that new mappings never shift
+SOURCE_BITS[UNMAPPED_SOURCE] = 1 << 62
+
+# Fields filled from the first source that has a non-empty value
+BEST_VALUE_FIELDS = ['Name', 'State', 'Organization']
+
+def get_drive_emails_folder():
+    """Get the emails_from_google_drive folder path"""
+    return Path(__file__).parent.parent / "emails_from_google_drive"
+
 def clean_email(email):
     """Clean and validate email addresses"""
     if pd.isna(email) or email == '':
@@ -16,6 +53,12 @@ def clean_email(email):
         return email
     return None
 
+def clean_field(value):
+    """Return a stripped string, treating missing values as empty"""
+    if pd.isna(value):
+        return ''
+    return str(value).strip()
+
 def extract_name_parts(name_str):
     """Extract first and last name from various formats"""
     if pd.isna(name_str) or name_str == '':
@@ -31,7 +74,7 @@ def extract_name_parts(name_str):
     return '', ''
 
 def process_file(file_path, source_name):
-    """Process individual CSV file and return standardized DataFrame"""
+    """Process individual CSV file and return standardized DataFrame, or None if it can't be read"""
     try:
         df = pd.read_csv(file_path)
         processed_data = []
@@ -50,23 +93,23 @@ def process_file(file_path, source_name):
             
             # Extract name
             if 'Name' in df.columns:
-                name = str(row.get('Name', '')).strip()
+                name = clean_field(row.get('Name'))
             elif 'First Name' in df.columns and 'Last Name' in df.columns:
-                first = str(row.get('First Name', '')).strip()
-                last = str(row.get('Last Name', '')).strip()
+                first = clean_field(row.get('First Name'))
+                last = clean_field(row.get('Last Name'))
                 name = f"{first} {last}".strip()
             elif 'Member Group' in df.columns:
-                name = str(row.get('Member Group', '')).strip()
+                name = clean_field(row.get('Member Group'))
                 organization = name
             
             # Extract other fields
             if 'State' in df.columns:
-                state = str(row.get('State', '')).strip()
+                state = clean_field(row.get('State'))
             elif 'State/Province/Region/County/Territory/Prefecture/Republic' in df.columns:
-                state = str(row.get('State/Province/Region/County/Territory/Prefecture/Republic', '')).strip()
+                state = clean_field(row.get('State/Province/Region/County/Territory/Prefecture/Republic'))
             
             if 'Org' in df.columns:
-                organization = str(row.get('Org', '')).strip()
+                organization = clean_field(row.get('Org'))
             
             # Only add if we have a valid email
             if email:
@@ -82,41 +125,86 @@ def process_file(file_path, source_name):
     
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
-        return pd.DataFrame()
+        return None
+
+def merge_sources(df):
+    """Collapse rows to one per email, OR-ing source bits into SourceMask"""
+    df = df.copy()
+    df['SourceMask'] = df['Source'].map(SOURCE_BITS).fillna(0).astype('int64')
+
+    # Each row carries a single bit, so summing distinct bits per email is an OR
+    df.loc[df.duplicated(subset=['Email', 'SourceMask']), 'SourceMask'] = 0
+
+    # Blank out empty values so 'first' skips them
+    for field in BEST_VALUE_FIELDS:
+        df[field] = df[field].replace('', pd.NA)
+
+    merged = df.groupby('Email', sort=False).agg({
+        'Name': 'first',
+        'Source': 'first',
+        'State': 'first',
+        'Organization': 'first',
+        'SourceMask': 'sum',
+    })
+
+    merged[BEST_VALUE_FIELDS] = merged[BEST_VALUE_FIELDS].fillna('')
+    merged = merged.reset_index()
+    return merged[['Name', 'Email', 'Source', 'State', 'Organization', 'SourceMask']]
+
+def sources_to_mask(*sources):
+    """Build a SourceMask value from source names"""
+    mask = 0
+    for source in sources:
+        if source not in SOURCE_BITS:
+            raise KeyError(f"Unknown source: {source}")
+        mask |= SOURCE_BITS[source]
+    return mask
+
+def mask_to_sources(mask):
+    """List the source names set in a SourceMask value"""
+    return [source for source, bit in SOURCE_BITS.items() if int(mask) & bit]
+
+def has_sources(df, *sources, match_all=True):
+    """Boolean mask of rows in all (or any, with match_all=False) of the given sources"""
+    if not sources:
+        raise ValueError("At least one source is required")
+
+    wanted = sources_to_mask(*sources)
+    hits = df['SourceMask'].astype('int64') & wanted
+    return hits == wanted if match_all else hits != 0
+
+def source_counts(df):
+    """Count how many emails belong to each source"""
+    masks = df['SourceMask'].astype('int64')
+    return pd.Series(
+        {source: int(((masks & bit) != 0).sum()) for source, bit in SOURCE_BITS.items()},
+        name='contacts',
+    )
 
 def consolidate_email_lists():
-    """Main function to consolidate all email lists"""
-    
-    # Define file mappings
-    file_mappings = {
-        '2018_speaking_tour_contacts.csv': '2018 Speaking Tour',
-        'Defund Racism Contact  - Everyone.csv': 'Defund Racism',
-        'US Campaign supporters - Sheet1.csv': 'US Campaign Supporters',
-        'US Campaign supporters - Sheet1 (1).csv': 'US Campaign Supporters',
-        'good_shepherd_collective_contacts.csv': 'Good Shepherd Collective',
-        'new_website_subscribers_backup.csv': 'Website Subscribers',
-        '50,000 final 1_19_2018.csv - 50,000 final 1_19_2018.csv.csv': 'International Contacts',
-        'Download.CSV - Download.CSV.csv': 'PayPal Subscribers',
-        'final_cleaning_7_21_2018_valid - final_cleaning_7_21_2018_valid.csv': 'Cleaned 2018 List',
-        'Untitled spreadsheet - Sheet1.csv': 'Additional Contacts',
-        'bot_subscribers_to_delete.csv': 'Bot Subscribers',
-        'wpforms-2013-Petition-ID-2013-2023-12-11-18-09-47 - wpforms-2013-Petition-ID-2013-2023-12-11-18-09-47.csv': 'Petition Signers',
-        'new report - new report.csv': 'New Report',
-        '2064876-6478ace66c7eaba50e79d802-jx7sWo - 2064876-6478ace66c7eaba50e79d802-jx7sWo.csv': 'Export Data',
-        'HcmComm-Customers-Export--2024-10-27-06-55-16 - HcmComm-Customers-Export--2024-10-27-06-55-16.csv': 'HcmComm Customers',
-        'Fundraising Report via SalesForce.xlsx - main.csv': 'SalesForce Fundraising'
-    }
+    """Main function to consolidate all email lists, returns None if any file fails to process"""
     
     all_data = []
-    base_path = Path('/Users/codyorourke/Desktop/emails')
+    failed_files = []
+    drive_folder = get_drive_emails_folder()
+    
+    # Mapped files first so they win duplicates, then any new exports
+    input_files = [(drive_folder / filename, source_name) for filename, source_name in FILE_MAPPINGS.items()]
+    input_files += [
+        (file_path, UNMAPPED_SOURCE)
+        for file_path in sorted(drive_folder.glob("*.csv"))
+        if file_path.name not in FILE_MAPPINGS
+    ]
     
     # Process each file
-    for filename, source_name in file_mappings.items():
-        file_path = base_path / filename
+    for file_path, source_name in input_files:
+        filename = file_path.name
         if file_path.exists():
             print(f"Processing: {filename}")
             df = process_file(file_path, source_name)
-            if not df.empty:
+            if df is None:
+                failed_files.append(filename)
+            elif not df.empty:
                 all_data.append(df)
                 print(f"  - Added {len(df)} records")
             else:
@@ -124,29 +212,39 @@ def consolidate_email_lists():
         else:
             print(f"File not found: {filename}")
     
+    # Don't publish a list that is missing a file we couldn't read
+    if failed_files:
+        print(f"\nFailed to process {len(failed_files)} files, not saving:")
+        for filename in failed_files:
+            print(f"  - {filename}")
+        return None
+    
     # Combine all data
     if all_data:
         consolidated_df = pd.concat(all_data, ignore_index=True)
         
-        # Remove duplicates based on email
+        # Merge duplicates by email, keeping every source in SourceMask
         print(f"\nTotal records before deduplication: {len(consolidated_df)}")
-        consolidated_df = consolidated_df.drop_duplicates(subset=['Email'], keep='first')
+        consolidated_df = merge_sources(consolidated_df)
         print(f"Total records after deduplication: {len(consolidated_df)}")
         
         # Sort by name
         consolidated_df = consolidated_df.sort_values('Name')
         
         # Save consolidated list
-        output_file = base_path / 'consolidated_email_list.csv'
+        output_file = Path(__file__).parent / 'consolidated_email_list.csv'
         consolidated_df.to_csv(output_file, index=False)
         print(f"\nConsolidated email list saved to: {output_file}")
         
         # Print summary statistics
         print(f"\nSummary:")
         print(f"Total unique emails: {len(consolidated_df)}")
+        multi_source = (consolidated_df['SourceMask'] & (consolidated_df['SourceMask'] - 1)) != 0
+        print(f"Emails found in more than one source: {multi_source.sum()}")
         print(f"Sources breakdown:")
-        for source in consolidated_df['Source'].value_counts().items():
-            print(f"  - {source[0]}: {source[1]} contacts")
+        for source, count in source_counts(consolidated_df).items():
+            if count:
+                print(f"  - {source}: {count} contacts")
         
         return consolidated_df
     else:
@@ -154,4 +252,4 @@ def consolidate_email_lists():
         return pd.DataFrame()
 
 if __name__ == "__main__":
-    consolidate_email_lists()
\ No newline at end of file
+    consolidate_email_lists()
@@ -80,23 +80,23 @@ def create_master_list(consolidated_df, omit_emails):
     return master_df
 
 def main():
-    """Main function to create master list"""
+    """Main function to create master list, returns True on success"""
     print("🚀 Creating master email list...")
     
     # Load omit emails
     omit_emails = load_omit_emails()
     if omit_emails is None:
-        return
+        return False
     
     # Load consolidated emails
     consolidated_df = load_consolidated_emails()
     if consolidated_df is None:
-        return
+        return False
     
     # Create master list
     master_df = create_master_list(consolidated_df, omit_emails)
     if master_df is None:
-        return
+        return False
     
     # Save master list
     master_file = Path(__file__).parent / "master.csv"
@@ -104,9 +104,11 @@ def main():
         master_df.to_csv(master_file, index=False, encoding='utf-8')
         print(f"✅ Created master.csv with {len(master_df)} clean emails")
         print(f"📁 File saved to: {master_file}")
+        return True
         
     except Exception as err:
         print(f"❌ Error writing master.csv: {err}")
+        return False
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -11,7 +11,7 @@ import pandas as pd
 
 def get_sendy_emails_folder():
     """Get the sendy_emails folder path"""
-    return Path(__file__).parent / "sendy_emails"
+    return Path(__file__).parent.parent / "sendy_emails"
 
 def extract_emails_from_csv(file_path):
     """Extract unique emails from a CSV file"""
@@ -31,19 +31,19 @@ def extract_emails_from_csv(file_path):
     return emails
 
 def main():
-    """Main function to create omit list"""
+    """Main function to create omit list, returns True on success"""
     print("🚀 Creating omit list from Sendy bad contacts...")
     
     sendy_folder = get_sendy_emails_folder()
     if not sendy_folder.exists():
         print(f"❌ Sendy emails folder not found: {sendy_folder}")
-        return
+        return False
     
     # Find all CSV files in sendy_emails folder
     csv_files = list(sendy_folder.glob("*.csv"))
     if not csv_files:
         print(f"❌ No CSV files found in {sendy_folder}")
-        return
+        return False
     
     print(f"📁 Found {len(csv_files)} CSV files to process")
     
@@ -70,9 +70,11 @@ def main():
         
         print(f"✅ Created omit.csv with {len(sorted_emails)} unique emails")
         print(f"📁 File saved to: {omit_file}")
+        return True
         
     except Exception as err:
         print(f"❌ Error writing omit.csv: {err}")
+        return False
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
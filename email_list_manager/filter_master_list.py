@@ -18,14 +18,14 @@ def contains_hebrew(text):
     return bool(re.search(hebrew_pattern, text))
 
 def main():
-    """Main function to filter master list"""
+    """Main function to filter master list, returns True on success"""
     print("🚀 Filtering master list to remove co.il emails and Hebrew names...")
     
     # Load master.csv
     master_file = Path(__file__).parent / "master.csv"
     if not master_file.exists():
         print(f"❌ master.csv not found")
-        return
+        return False
     
     try:
         df = pd.read_csv(master_file)
@@ -34,7 +34,7 @@ def main():
         
     except Exception as err:
         print(f"❌ Error reading master.csv: {err}")
-        return
+        return False
     
     # Filter out emails ending with co.il
     co_il_mask = df['Email'].astype(str).str.lower().str.endswith('.co.il')
@@ -63,9 +63,11 @@ def main():
         # Also update the original master.csv
         df_final.to_csv(master_file, index=False, encoding='utf-8')
         print(f"✅ Updated master.csv with filtered results")
+        return True
         
     except Exception as err:
         print(f"❌ Error writing filtered files: {err}")
+        return False
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Watch Pipeline Script
+Watches emails_from_google_drive and sendy_emails for new files and re-runs
+only the pipeline stages affected by the change
+"""
+
+import time
+from pathlib import Path
+
+import consolidate_emails
+import create_master_list
+import create_omit_list
+import filter_master_list
+
+# Seconds between folder scans
+POLL_INTERVAL = 1.0
+
+# Seconds a folder must be quiet before stale stages are rebuilt
+DEBOUNCE_SECONDS = 3.0
+
+def run_consolidate():
+    """Consolidate the Drive exports, returns True on success"""
+    consolidated_df = consolidate_emails.consolidate_email_lists()
+    return consolidated_df is not None and not consolidated_df.empty
+
+# Pipeline stages in the order they must run, each returns True on success
+STAGES = {
+    'consolidate': run_consolidate,
+    'omit': create_omit_list.main,
+    'master': create_master_list.main,
+    'filter': filter_master_list.main,
+}
+
+# Which stages each stage reads the output of
+STAGE_DEPENDENCIES = {
+    'consolidate': [],
+    'omit': [],
+    'master': ['consolidate', 'omit'],
+    'filter': ['master'],
+}
+
+# File each watched stage writes, used to spot changes made while not watching
+STAGE_OUTPUTS = {
+    'consolidate': 'consolidated_email_list.csv',
+    'omit': 'omit.csv',
+}
+
+def get_watched_folders():
+    """Get the watched folder paths mapped to the stage that reads them"""
+    return {
+        consolidate_emails.get_drive_emails_folder(): 'consolidate',
+        create_omit_list.get_sendy_emails_folder(): 'omit',
+    }
+
+def snapshot_folder(folder):
+    """Return {path: (mtime, size)} for every CSV file in a folder"""
+    snapshot = {}
+    if not folder.exists():
+        return snapshot
+
+    for csv_file in folder.glob("*.csv"):
+        try:
+            stat = csv_file.stat()
+        except OSError:
+            # File was removed between glob and stat
+            continue
+        snapshot[csv_file] = (stat.st_mtime, stat.st_size)
+    return snapshot
+
+def stale_stages(changed_stages):
+    """Return the changed stages plus every stage downstream of them, in run order"""
+    stale = set(changed_stages)
+
+    # STAGES is in dependency order, so one pass picks up the whole chain
+    for stage in STAGES:
+        if any(dependency in stale for dependency in STAGE_DEPENDENCIES[stage]):
+            stale.add(stage)
+
+    return [stage for stage in STAGES if stage in stale]
+
+def outdated_stages(folders, snapshots):
+    """Return watched stages whose output is missing or older than their newest input"""
+    outdated = set()
+    for folder, stage in folders.items():
+        if not snapshots[folder]:
+            continue
+
+        newest_input = max(mtime for mtime, _ in snapshots[folder].values())
+        output_file = Path(__file__).parent / STAGE_OUTPUTS[stage]
+        if not output_file.exists() or output_file.stat().st_mtime < newest_input:
+            outdated.add(stage)
+    return outdated
+
+def run_stages(stages):
+    """Run the given stages in order, returns the stages that did not finish"""
+    for stage in stages:
+        print(f"\n🔄 Running stage: {stage}")
+        try:
+            succeeded = STAGES[stage]()
+        except Exception as err:
+            print(f"❌ Stage {stage} failed: {err}")
+            succeeded = False
+
+        if not succeeded:
+            print(f"❌ Stage {stage} did not complete")
+            print(f"⏭️  Skipping remaining stages: {stages[stages.index(stage) + 1:]}")
+            return stages[stages.index(stage):]
+    return []
+
+def watch(poll_interval=POLL_INTERVAL, debounce_seconds=DEBOUNCE_SECONDS):
+    """Poll the watched folders and rebuild stale stages once changes settle"""
+    folders = get_watched_folders()
+    snapshots = {folder: snapshot_folder(folder) for folder in folders}
+
+    # Failed stages wait for the next folder change before retrying
+    retry_stages = set()
+
+    for folder in folders:
+        status = "✅" if folder.exists() else "⚠️  (not found yet)"
+        print(f"👀 Watching {folder} {status}")
+
+    # Catch up on files dropped while the watcher wasn't running
+    pending_stages = outdated_stages(folders, snapshots)
+    last_change = time.monotonic()
+    if pending_stages:
+        print(f"📁 Outputs older than inputs for: {', '.join(sorted(pending_stages))}")
+
+    while True:
+        for folder, stage in folders.items():
+            current = snapshot_folder(folder)
+            if current != snapshots[folder]:
+                added = current.keys() - snapshots[folder].keys()
+                removed = snapshots[folder].keys() - current.keys()
+                modified = [path for path in current.keys() & snapshots[folder].keys()
+                            if current[path] != snapshots[folder][path]]
+                print(f"📁 {folder.name}: {len(added)} added, "
+                      f"{len(modified)} modified, {len(removed)} removed")
+
+                snapshots[folder] = current
+                pending_stages.add(stage)
+                last_change = time.monotonic()
+
+        # Wait for a burst of file events to settle before rebuilding
+        if pending_stages and time.monotonic() - last_change >= debounce_seconds:
+            stages = stale_stages(pending_stages | retry_stages)
+            pending_stages.clear()
+
+            print(f"\n🚀 Rebuilding stale stages: {', '.join(stages)}")
+            started = time.monotonic()
+            unfinished = run_stages(stages)
+            retry_stages = set(unfinished)
+            if unfinished:
+                print(f"\n⏳ Will retry {', '.join(unfinished)} on the next change")
+            else:
+                print(f"\n🎉 Pipeline up to date in {time.monotonic() - started:.1f}s")
+
+        time.sleep(poll_interval)
+
+def main():
+    """Main function to start watch mode"""
+    print("🚀 Starting pipeline watch mode (Ctrl+C to stop)...")
+    try:
+        watch()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+if __name__ == "__main__":
+    main()